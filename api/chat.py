@@ -6,7 +6,7 @@ from backend.models import UUID, JobCreate, JobFilter, Profile, StepFilter
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
 from lib.logger import configure_logger
 from lib.websocket_manager import manager
-from services.chat import process_chat_message, running_jobs
+from services.chat import ChatOutputQueue, process_chat_message, running_jobs
 from typing import List
 
 # Configure logger
@@ -76,7 +76,6 @@ def get_thread_history(thread_id: UUID, profile_id: UUID) -> List:
                     "thread_id": str(thread.id),
                     "type": type,
                 }
-                print(formatted_msg)
                 formatted_history.append(formatted_msg)
 
         # Sort messages by timestamp
@@ -141,7 +140,7 @@ async def websocket_endpoint(
                         )
                     )
                     job_id = job.id
-                    output_queue = asyncio.Queue()
+                    output_queue = ChatOutputQueue()
 
                     # Store job info
                     running_jobs[str(job_id)] = {
@@ -3,7 +3,6 @@ from .abstract import AbstractBackend
 from .supabase import SupabaseBackend
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
-from sqlalchemy.pool import NullPool
 from supabase import Client, create_client
 
 load_dotenv()
@@ -23,7 +22,15 @@ def get_backend() -> AbstractBackend:
         PORT = os.getenv("AIBTC_SUPABASE_PORT")
         DBNAME = os.getenv("AIBTC_SUPABASE_DBNAME")
         DATABASE_URL = f"postgresql+psycopg2://{USER}:{PASSWORD}@{HOST}:{PORT}/{DBNAME}?sslmode=require"
-        engine = create_engine(DATABASE_URL, poolclass=NullPool)
+        # Keep a small pool of checked connections instead of opening a new
+        # TLS connection for every secret lookup
+        engine = create_engine(
+            DATABASE_URL,
+            pool_size=3,
+            max_overflow=2,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+        )
 
         URL = os.getenv("AIBTC_SUPABASE_URL")
         SERVICE_KEY = os.getenv("AIBTC_SUPABASE_SERVICE_KEY")
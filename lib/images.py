@@ -7,6 +7,11 @@ load_dotenv()
 openai.api_key = os.getenv("OPENAI_API_KEY")
 
 
+# Shared client so image requests reuse one connection pool. Created at
+# import, like the chat model in services.langgraph.
+_client = openai.OpenAI()
+
+
 class ImageGenerationError(Exception):
     """Raised when image generation fails"""
 
@@ -26,8 +31,7 @@ def generate_image(prompt: str) -> str:
         ImageGenerationError: If image generation fails
     """
     try:
-        client = openai.OpenAI()
-        response = client.images.generate(
+        response = _client.images.generate(
             model="dall-e-3", quality="hd", prompt=prompt, n=1, size="1024x1024"
         )
         if not response or not response.data:
@@ -3,7 +3,7 @@ from backend.factory import backend
 from dataclasses import dataclass
 from lib.images import generate_token_image
 from lib.logger import configure_logger
-from typing import Dict, Optional
+from typing import NamedTuple, Optional
 
 logger = configure_logger(__name__)
 
@@ -37,6 +37,13 @@ class TokenMetadata:
     uri: Optional[str] = None
 
 
+class TokenAssets(NamedTuple):
+    """Public URLs of a token's stored image and metadata."""
+
+    image_url: str
+    metadata_url: str
+
+
 class TokenAssetManager:
     # Default configuration
     DEFAULT_EXTERNAL_URL = "https://aibtc.dev/"
@@ -102,7 +109,7 @@ class TokenAssetManager:
                 f"Failed to store metadata for token {self.token_id}: {str(e)}"
             ) from e
 
-    def generate_all_assets(self, metadata: TokenMetadata) -> Dict[str, str]:
+    def generate_all_assets(self, metadata: TokenMetadata) -> TokenAssets:
         """Generate and store all token assets, return URLs
 
         Raises:
@@ -120,7 +127,7 @@ class TokenAssetManager:
             metadata_url = self.generate_and_store_metadata(metadata)
             logger.debug(f"Generated metadata URL: {metadata_url}")
 
-            return {"image_url": image_url, "metadata_url": metadata_url}
+            return TokenAssets(image_url=image_url, metadata_url=metadata_url)
         except Exception as e:
             logger.error(
                 f"Failed to generate assets for token {self.token_id}: {str(e)}"
@@ -2,12 +2,13 @@ import asyncio
 import datetime
 from backend.factory import backend
 from backend.models import UUID, JobBase, Profile, StepCreate
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from lib.logger import configure_logger
 from lib.persona import generate_persona, generate_static_persona
 from services.langgraph import execute_langgraph_stream
 from tools.tools_factory import initialize_tools
-from typing import Optional
+from typing import Dict, Optional
 
 logger = configure_logger(__name__)
 
@@ -15,6 +16,52 @@ thread_pool = ThreadPoolExecutor()
 running_jobs = {}
 
 
+def _is_token_chunk(message: Optional[Dict]) -> bool:
+    """Return whether a message is a streamed token that can be merged."""
+    return (
+        message is not None
+        and message.get("type") == "token"
+        and message.get("status") == "processing"
+    )
+
+
+class ChatOutputQueue:
+    """Messages waiting to be sent to the websocket for one chat job.
+
+    A token message put while the previous token message is still waiting is
+    appended to it, so a slow or stalled client holds one pending token
+    message instead of one per token. Tool, end and completion messages are
+    always queued on their own.
+    """
+
+    def __init__(self):
+        self._messages = deque()
+        self._ready = asyncio.Event()
+
+    async def put(self, message: Optional[Dict]) -> None:
+        """Queue a message, merging it into a waiting token message if possible."""
+        if (
+            self._messages
+            and _is_token_chunk(message)
+            and _is_token_chunk(self._messages[-1])
+        ):
+            pending = self._messages[-1]
+            self._messages[-1] = {
+                **pending,
+                "content": pending["content"] + message["content"],
+            }
+        else:
+            self._messages.append(message)
+        self._ready.set()
+
+    async def get(self) -> Optional[Dict]:
+        """Wait for and return the next message."""
+        while not self._messages:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._messages.popleft()
+
+
 async def process_chat_message(
     job_id: UUID,
     thread_id: UUID,
@@ -22,7 +69,7 @@ async def process_chat_message(
     agent_id: Optional[UUID],
     input_str: str,
     history: list,
-    output_queue: asyncio.Queue,
+    output_queue: ChatOutputQueue,
 ):
     """Process a chat message.
 
@@ -32,24 +79,16 @@ async def process_chat_message(
         profile (Profile): The user's profile information
         input_str (str): The input string for the chat job
         history (list): The thread history
-        output_queue (asyncio.Queue): The output queue for WebSocket streaming
+        output_queue (ChatOutputQueue): The output queue for WebSocket streaming
 
     Raises:
         Exception: If the chat message cannot be processed
     """
     try:
-        results = []
         first_end = True
 
-        # Add initial user message
-        results.append(
-            {
-                "role": "user",
-                "type": "user",
-                "content": input_str,
-                "timestamp": datetime.datetime.now().isoformat(),
-            }
-        )
+        # Latest non-empty result content, falling back to the user input
+        final_result_content = input_str
 
         # For langgraph, accumulate tokens and only save complete messages
         current_message = {
@@ -126,7 +165,7 @@ async def process_chat_message(
                     except Exception as e:
                         logger.error(f"Error creating tool execution step: {e}")
                 elif tool_phase == "start":
-                    # Add to results for streaming
+                    # Stream the tool execution
                     tool_execution = {
                         "role": "assistant",
                         "type": "tool",
@@ -137,7 +176,6 @@ async def process_chat_message(
                         "thread_id": str(thread_id),
                         "agent_id": str(agent_id) if agent_id else None,
                     }
-                    results.append(tool_execution)
                     await output_queue.put(tool_execution)
 
                 # Reset current message
@@ -179,20 +217,7 @@ async def process_chat_message(
                             tool_output=None,
                         )
                     )
-                    results.append(
-                        {
-                            **current_message,
-                            "timestamp": datetime.datetime.now().isoformat(),
-                        }
-                    )
-
-        final_result = None
-        for result in reversed(results):
-            if result.get("content"):
-                final_result = result
-                break
-
-        final_result_content = final_result.get("content", "") if final_result else ""
+                    final_result_content = current_message["content"]
 
         backend.update_job(
             job_id=job_id,
@@ -2,7 +2,7 @@ from backend.factory import backend
 from backend.models import DAO, UUID, DAOCreate, Token, TokenBase, TokenCreate
 from lib.logger import configure_logger
 from lib.token_assets import TokenAssetError, TokenAssetManager, TokenMetadata
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 logger = configure_logger(__name__)
 
@@ -42,7 +42,11 @@ def generate_dao_dependencies(
         DAO: The created DAO record
     """
     logger.debug(
-        f"Creating dao with name={name}, mission={mission}, description={description}, wallet_id={wallet_id}"
+        "Creating dao with name=%s, mission=%s, description=%s, wallet_id=%s",
+        name,
+        mission,
+        description,
+        wallet_id,
     )
     try:
         dao = backend.create_dao(
@@ -53,8 +57,8 @@ def generate_dao_dependencies(
                 wallet_id=wallet_id,
             )
         )
-        logger.debug(f"Created dao type: {type(dao)}")
-        logger.debug(f"Created dao content: {dao}")
+        logger.debug("Created dao type: %s", type(dao))
+        logger.debug("Created dao content: %s", dao)
 
         return dao
     except Exception as e:
@@ -68,6 +72,7 @@ def generate_token_dependencies(
     token_description: str,
     token_decimals: int,
     token_max_supply: str,
+    dao_id: Optional[UUID] = None,
 ) -> Tuple[str, Token]:
     """Generate token dependencies including database record, image, and metadata.
 
@@ -77,6 +82,7 @@ def generate_token_dependencies(
         token_description: Description of the token
         token_decimals: Number of decimals for the token
         token_max_supply: Maximum supply of the token
+        dao_id: Optional ID of the DAO to bind the token to in the same update
 
     Returns:
         Tuple[str, Dict]: Token metadata URL and token details
@@ -88,9 +94,13 @@ def generate_token_dependencies(
     """
     try:
         logger.debug(
-            f"Creating token with name={token_name}, symbol={token_symbol}, "
-            f"description={token_description}, decimals={token_decimals}, "
-            f"max_supply={token_max_supply}"
+            "Creating token with name=%s, symbol=%s, description=%s, "
+            "decimals=%s, max_supply=%s",
+            token_name,
+            token_symbol,
+            token_description,
+            token_decimals,
+            token_max_supply,
         )
         # Create initial token record
         token_create = TokenCreate(
@@ -101,14 +111,14 @@ def generate_token_dependencies(
             max_supply=token_max_supply,
             status="DRAFT",
         )
-        logger.debug(f"TokenCreate object: {token_create}")
+        logger.debug("TokenCreate object: %s", token_create)
 
         new_token = backend.create_token(new_token=token_create)
-        logger.debug(f"Created token type: {type(new_token)}")
-        logger.debug(f"Created token content: {new_token}")
+        logger.debug("Created token type: %s", type(new_token))
+        logger.debug("Created token content: %s", new_token)
 
         token_id = new_token.id
-        logger.debug(f"Created token record with ID: {token_id}")
+        logger.debug("Created token record with ID: %s", token_id)
 
         # Create metadata object
         metadata = TokenMetadata(
@@ -118,36 +128,39 @@ def generate_token_dependencies(
             decimals=token_decimals,
             max_supply=token_max_supply,
         )
-        logger.debug(f"Created TokenMetadata: {metadata}")
+        logger.debug("Created TokenMetadata: %s", metadata)
 
         # Generate and store assets
         asset_manager = TokenAssetManager(token_id)
         try:
             logger.debug("Generating token assets...")
             assets = asset_manager.generate_all_assets(metadata)
-            logger.debug(f"Generated assets: {assets}")
-
-            # Update token record with asset URLs
-            token_update = TokenBase(
-                uri=assets["metadata_url"],
-                image_url=assets["image_url"],
-            )
-            logger.debug(f"Updating token with: {token_update}")
+            logger.debug("Generated assets: %s", assets)
+
+            # Update token record with asset URLs, binding the DAO if known
+            asset_fields = {
+                "uri": assets.metadata_url,
+                "image_url": assets.image_url,
+            }
+            if dao_id is not None:
+                asset_fields["dao_id"] = dao_id
+            token_update = TokenBase(**asset_fields)
+            logger.debug("Updating token with: %s", token_update)
 
             update_result = backend.update_token(
                 token_id=token_id, update_data=token_update
             )
-            logger.debug(f"Token update result: {update_result}")
+            logger.debug("Token update result: %s", update_result)
 
             if not update_result:
                 raise TokenUpdateError(
                     "Failed to update token record with asset URLs",
-                    {"token_id": token_id, "assets": assets},
+                    {"token_id": token_id, "assets": assets._asdict()},
                 )
 
-            logger.debug(f"Final token data content: {update_result}")
+            logger.debug("Final token data content: %s", update_result)
 
-            return assets["metadata_url"], update_result
+            return assets.metadata_url, update_result
 
         except TokenAssetError as e:
             logger.error(f"Failed to generate token assets: {e}", exc_info=True)
@@ -173,13 +186,13 @@ def bind_token_to_dao(token_id: UUID, dao_id: UUID):
     Returns:
         bool: True if binding was successful, False otherwise
     """
-    logger.debug(f"Binding token {token_id} to DAO {dao_id}")
+    logger.debug("Binding token %s to DAO %s", token_id, dao_id)
     try:
         token_update = TokenBase(dao_id=dao_id)
-        logger.debug(f"Token update data: {token_update}")
+        logger.debug("Token update data: %s", token_update)
 
         result = backend.update_token(token_id=token_id, update_data=token_update)
-        logger.debug(f"Bind result: {result}")
+        logger.debug("Bind result: %s", result)
         return result
     except Exception as e:
         logger.error(f"Failed to bind token to DAO: {str(e)}", exc_info=True)
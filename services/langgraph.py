@@ -1,43 +1,107 @@
 import asyncio
+import json
+from functools import lru_cache
 from langchain.callbacks.base import BaseCallbackHandler
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_core.outputs import LLMResult
+from langchain_core.runnables import Runnable, RunnableConfig
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.message import add_messages
 from langgraph.prebuilt import ToolNode
 from lib.logger import configure_logger
-from typing import Annotated, Dict, List, Optional, TypedDict
+from typing import Annotated, Dict, List, Optional, Tuple, TypedDict
 
 logger = configure_logger(__name__)
 
+# History is sent as an append-only window that only moves forward in steps of
+# HISTORY_BUCKET messages, so consecutive turns share a stable prompt prefix
+# that OpenAI's prompt cache can reuse. At least HISTORY_MIN_CONTEXT recent
+# messages are always included.
+HISTORY_BUCKET = 20
+HISTORY_MIN_CONTEXT = 10
+
+# LangChain message types for the history roles passed to the model
+_HISTORY_ROLES = {"user": HumanMessage, "assistant": AIMessage}
+
+# Queued after the workflow finishes so the stream loop knows to stop reading
+_STREAM_DONE = {"type": "done"}
+
+
+def put_from_any_thread(
+    loop: asyncio.AbstractEventLoop, queue: asyncio.Queue, item: Dict
+) -> None:
+    """Put an item on a queue owned by ``loop`` from whichever thread is calling.
+
+    Callbacks from the async model node run on the loop itself and enqueue
+    directly; only callbacks fired from worker threads pay for a wakeup.
+    """
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is loop:
+        queue.put_nowait(item)
+    else:
+        loop.call_soon_threadsafe(queue.put_nowait, item)
+
+
+def history_window_start(history_length: int) -> int:
+    """Return the index of the first history message to send to the model."""
+    if history_length <= HISTORY_MIN_CONTEXT:
+        return 0
+    buckets = (history_length - HISTORY_MIN_CONTEXT) // HISTORY_BUCKET
+    return buckets * HISTORY_BUCKET
+
+
+def coalesce_queued_tokens(
+    data: Dict, queue: asyncio.Queue
+) -> Tuple[Dict, Optional[Dict]]:
+    """Merge token events already waiting in the queue into a single event.
+
+    Returns the merged token event and the first non-token item taken off the
+    queue, if any, which the caller must handle next.
+    """
+    parts = [data["content"]]
+    while not queue.empty():
+        queued = queue.get_nowait()
+        if queued is _STREAM_DONE or queued["type"] != "token":
+            break
+        parts.append(queued["content"])
+    else:
+        queued = None
+    if len(parts) > 1:
+        data = {"type": "token", "content": "".join(parts)}
+    return data, queued
+
+
+# Shared chat client so every request reuses the same HTTP connection pool
+chat_model = ChatOpenAI(streaming=True, model="gpt-4o", temperature=0.7)
+
+
+class _ToolNames(tuple):
+    """Tool names used to key the bound chat cache, carrying the tools to bind.
+
+    Binding only depends on each tool's name and schema, so the result can be
+    shared across requests even though the tool instances are per profile.
+    """
+
+    def __new__(cls, names: Tuple[str, ...], tools: List):
+        key = super().__new__(cls, names)
+        key.tools = tools
+        return key
 
-def extract_filtered_content(history: List) -> List[Dict]:
-    """Extract and filter content from chat history."""
-    logger.debug(
-        f"Starting content extraction from history with {len(history)} messages"
-    )
-    filtered_content = []
-    for message in history:
-        logger.debug(f"Processing message type: {message.get('role')}")
-        if message.get("role") == "user":
-            filtered_content.append(
-                {
-                    "role": "user",
-                    "content": message.get("content", ""),
-                }
-            )
-        elif message.get("role") == "assistant":
-            filtered_content.append(
-                {
-                    "role": "assistant",
-                    "content": message.get("content", ""),
-                }
-            )
-    logger.debug(
-        f"Finished filtering content, extracted {len(filtered_content)} messages"
-    )
-    return filtered_content
+
+@lru_cache(maxsize=32)
+def _bind_chat(tool_names: _ToolNames) -> Runnable:
+    """Bind the shared chat model to a set of tools."""
+    logger.debug("Binding chat model to %d tools", len(tool_names))
+    return chat_model.bind_tools(tool_names.tools)
+
+
+def get_tool_bound_chat(tools: List) -> Runnable:
+    """Return a streaming chat model bound to the given tools, building it once."""
+    return _bind_chat(_ToolNames(tuple(tool.name for tool in tools), tools))
 
 
 # -----------------------------------------------------
@@ -48,76 +112,72 @@ def extract_filtered_content(history: List) -> List[Dict]:
 class StreamingCallbackHandler(BaseCallbackHandler):
     """Callback handler for streaming tokens."""
 
-    def __init__(self, queue: asyncio.Queue, on_llm_new_token=None, on_llm_end=None):
-        """Initialize the callback handler with a queue and optional callbacks."""
+    # Every hook only schedules a queue put, so run it directly on the event
+    # loop instead of letting LangChain hand each callback to a thread pool
+    run_inline = True
+
+    def __init__(
+        self,
+        queue: asyncio.Queue,
+        loop: asyncio.AbstractEventLoop,
+        on_llm_new_token=None,
+        on_llm_end=None,
+    ):
+        """Initialize the callback handler with a queue, its event loop and optional callbacks."""
         super().__init__()
         self.queue = queue
+        self._loop = loop
         self._on_llm_new_token = on_llm_new_token
         self._on_llm_end = on_llm_end
-        self.tokens = []
-        self.current_tool = None
-        self._loop = None
+        # Tool names keyed by run_id, since ToolNode runs tool calls concurrently
+        self.current_tools = {}
         logger.debug("Initialized StreamingCallbackHandler")
 
-    def _ensure_loop(self):
-        """Ensure we have a valid event loop."""
-        try:
-            self._loop = asyncio.get_event_loop()
-        except RuntimeError:
-            logger.warning("No event loop found, creating new one")
-            self._loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._loop)
-        return self._loop
-
     def _put_to_queue(self, item):
-        """Helper method to put items in queue."""
-        loop = self._ensure_loop()
+        """Put an item onto the queue without waiting for the loop to drain it."""
         try:
-            if loop.is_running():
-                future = asyncio.run_coroutine_threadsafe(self.queue.put(item), loop)
-                future.result()  # Wait for it to complete
-            else:
-                loop.run_until_complete(self.queue.put(item))
+            put_from_any_thread(self._loop, self.queue, item)
             logger.debug(
-                f"Successfully queued item of type: {item.get('type', 'unknown')}"
+                "Successfully queued item of type: %s", item.get("type", "unknown")
             )
         except Exception as e:
-            logger.error(f"Failed to put item in queue: {str(e)}")
+            logger.error("Failed to put item in queue: %s", e)
             raise
 
     def on_tool_start(self, serialized: Dict, input_str: str, **kwargs):
         """Run when tool starts running."""
-        self.current_tool = serialized.get("name")
+        tool_name = serialized.get("name")
+        self.current_tools[kwargs.get("run_id")] = tool_name
         tool_execution = {
             "type": "tool",
-            "tool": self.current_tool,
+            "tool": tool_name,
             "input": input_str,
             "status": "start",
         }
         self._put_to_queue(tool_execution)
-        logger.info(
-            f"Tool started: {self.current_tool} with input: {input_str[:100]}..."
-        )
+        logger.info("Tool started: %s with input: %.100s...", tool_name, input_str)
 
     def on_tool_end(self, output: str, **kwargs):
         """Run when tool ends running."""
-        if self.current_tool:
+        tool_name = self.current_tools.pop(kwargs.get("run_id"), None)
+        if tool_name:
             # Extract just the content if it's a ToolMessage
             if hasattr(output, "content"):
                 output = output.content
+            if not isinstance(output, str):
+                output = json.dumps(output, default=str)
 
             tool_execution = {
                 "type": "tool",
-                "tool": self.current_tool,
+                "tool": tool_name,
                 "input": None,
-                "output": str(output),
+                "output": output,
                 "status": "end",
             }
             self._put_to_queue(tool_execution)
             logger.info(
-                f"Tool {self.current_tool} completed with output length: {len(str(output))}"
+                "Tool %s completed with output length: %d", tool_name, len(output)
             )
-            self.current_tool = None
 
     def on_llm_start(self, *args, **kwargs):
         """Run when LLM starts running."""
@@ -127,8 +187,6 @@ class StreamingCallbackHandler(BaseCallbackHandler):
         """Run on new token. Only available when streaming is enabled."""
         if self._on_llm_new_token:
             self._on_llm_new_token(token, **kwargs)
-        self.tokens.append(token)
-        logger.debug(f"Received new token (length: {len(token)})")
 
     def on_llm_end(self, response: LLMResult, **kwargs):
         """Run when LLM ends running."""
@@ -138,24 +196,26 @@ class StreamingCallbackHandler(BaseCallbackHandler):
 
     def on_llm_error(self, error: Exception, **kwargs):
         """Run when LLM errors."""
-        logger.error(f"LLM error occurred: {str(error)}", exc_info=True)
+        logger.error("LLM error occurred: %s", error, exc_info=True)
 
     def on_tool_error(self, error: Exception, **kwargs):
         """Run when tool errors."""
-        if self.current_tool:
+        tool_name = self.current_tools.pop(kwargs.get("run_id"), None)
+        if tool_name:
             tool_execution = {
                 "type": "tool",
-                "tool": self.current_tool,
+                "tool": tool_name,
                 "input": None,
                 "output": f"Error: {str(error)}",
                 "status": "error",
             }
             self._put_to_queue(tool_execution)
             logger.error(
-                f"Tool {self.current_tool} failed with error: {str(error)}",
+                "Tool %s failed with error: %s",
+                tool_name,
+                error,
                 exc_info=True,
             )
-            self.current_tool = None
 
 
 # -----------------------------------------------------
@@ -169,6 +229,49 @@ class State(TypedDict):
     messages: Annotated[list, add_messages]
 
 
+def should_continue(state: State) -> str:
+    """Route to the tool node while the model keeps requesting tool calls."""
+    messages = state["messages"]
+    last_message = messages[-1]
+    result = "tools" if last_message.tool_calls else END
+    logger.debug("Continue decision: %s", result)
+    return result
+
+
+async def call_model(state: State, config: RunnableConfig):
+    """Call the request's tool-bound chat model on the current messages."""
+    logger.debug("Calling model with current state")
+    chat = config["configurable"]["chat"]
+    response = await chat.ainvoke(state["messages"], config)
+    logger.debug("Received model response")
+    return {"messages": [response]}
+
+
+async def call_tools(state: State, config: RunnableConfig):
+    """Run the tool calls from the last message with the request's tool node."""
+    tool_node = config["configurable"]["tool_node"]
+    return await tool_node.ainvoke(state, config)
+
+
+def build_agent_graph() -> Runnable:
+    """Build the agent/tools loop shared by every chat stream.
+
+    The topology never changes between requests, so it is compiled once. The
+    chat model and tool node differ per profile and are supplied through
+    ``config["configurable"]`` when the graph is invoked.
+    """
+    workflow = StateGraph(State)
+    workflow.add_node("agent", call_model)
+    workflow.add_node("tools", call_tools)
+    workflow.add_edge(START, "agent")
+    workflow.add_conditional_edges("agent", should_continue)
+    workflow.add_edge("tools", "agent")
+    return workflow.compile()
+
+
+agent_graph = build_agent_graph()
+
+
 async def execute_langgraph_stream(
     history: List[Dict],
     input_str: str,
@@ -184,134 +287,110 @@ async def execute_langgraph_stream(
     """
     logger.info("Starting new LangGraph chat stream execution")
     logger.debug(
-        f"Input parameters - History length: {len(history)}, Persona present: {bool(persona)}, Tools count: {len(tools_map) if tools_map else 0}"
+        "Input parameters - History length: %d, Persona present: %s, Tools count: %d",
+        len(history),
+        bool(persona),
+        len(tools_map) if tools_map else 0,
     )
 
     callback_queue = asyncio.Queue()
 
-    # Filter the history if needed
-    filtered_content = extract_filtered_content(history)
-
-    # Ensure there's an event loop
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        logger.warning("No running event loop found, creating new one")
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    # Callbacks may fire on worker threads and hand events back to this loop
+    loop = asyncio.get_running_loop()
 
     # Convert thread history to LangChain message format
     messages = []
 
     # 1. Optionally add the persona as a SystemMessage
     if persona:
-        logger.debug(f"Adding persona message: {persona[:100]}...")
+        logger.debug("Adding persona message: %.100s...", persona)
         messages.append(SystemMessage(content=persona))
 
-    # 2. Convert existing thread
-    logger.debug("Converting thread history to LangChain format")
-    for msg in filtered_content:
-        if msg["role"] == "user":
-            messages.append(HumanMessage(content=msg["content"]))
-        else:
-            content = msg.get("content") or ""
-            if "tool_calls" in msg:
-                messages.append(
-                    AIMessage(content=content, tool_calls=msg["tool_calls"])
-                )
-            else:
-                messages.append(AIMessage(content=content))
+    # 2. Convert the recent thread window, keeping only user and assistant turns
+    recent_history = history[history_window_start(len(history)) :]
+    logger.debug(
+        "Converting %d of %d history messages to LangChain format",
+        len(recent_history),
+        len(history),
+    )
+    messages.extend(
+        _HISTORY_ROLES[msg["role"]](content=msg.get("content") or "")
+        for msg in recent_history
+        if msg.get("role") in _HISTORY_ROLES
+    )
 
     # 3. Add the current user input
-    logger.debug(f"Adding current user input: {input_str[:100]}...")
+    logger.debug("Adding current user input: %.100s...", input_str)
     messages.append(HumanMessage(content=input_str))
-    logger.info(f"Prepared message chain with {len(messages)} total messages")
+    logger.info("Prepared message chain with %d total messages", len(messages))
 
     # Create a streaming callback handler
     callback_handler = StreamingCallbackHandler(
         queue=callback_queue,
-        on_llm_new_token=lambda token, **kwargs: asyncio.run_coroutine_threadsafe(
-            callback_queue.put({"type": "token", "content": token}), loop
+        loop=loop,
+        on_llm_new_token=lambda token, **kwargs: put_from_any_thread(
+            loop, callback_queue, {"type": "token", "content": token}
         ),
-        on_llm_end=lambda *args, **kwargs: asyncio.run_coroutine_threadsafe(
-            callback_queue.put({"type": "end"}), loop
+        on_llm_end=lambda *args, **kwargs: put_from_any_thread(
+            loop, callback_queue, {"type": "end"}
         ),
     )
 
-    # Create the chat model with streaming
-    logger.debug("Initializing ChatOpenAI model")
-    chat = ChatOpenAI(
-        streaming=True,
-        model="gpt-4o",
-        callbacks=[callback_handler],
-        temperature=0.7,
-    ).bind_tools(list(tools_map.values()))
-
-    # Create the tool node and config with callbacks
-    tool_node = ToolNode(list(tools_map.values()))
-    config = {"callbacks": [callback_handler]}
-
-    # Define the function that determines whether to continue or not
-    def should_continue(state: State) -> str:
-        messages = state["messages"]
-        last_message = messages[-1]
-        result = "tools" if last_message.tool_calls else END
-        logger.debug(f"Continue decision: {result}")
-        return result
-
-    # Define the function that calls the model
-    def call_model(state: State):
-        logger.debug("Calling model with current state")
-        messages = state["messages"]
-        response = chat.invoke(messages)
-        logger.debug("Received model response")
-        return {"messages": [response]}
-
-    # Define the graph
-    logger.debug("Setting up LangGraph workflow")
-    workflow = StateGraph(State)
-    workflow.add_node("agent", call_model)
-    workflow.add_node("tools", tool_node)
-    workflow.add_edge(START, "agent")
-    workflow.add_conditional_edges("agent", should_continue)
-    workflow.add_edge("tools", "agent")
-
-    # Compile the graph
-    logger.debug("Compiling workflow")
-    runnable = workflow.compile()
+    # Get the shared chat model; callbacks are supplied per request via config
+    tools = list(tools_map.values())
+    chat = get_tool_bound_chat(tools)
 
-    # Run the graph with config including callbacks
-    logger.info("Starting workflow execution")
-    task = asyncio.create_task(runnable.ainvoke({"messages": messages}, config=config))
+    # Create the tool node and config with callbacks and per-request context
+    tool_node = ToolNode(tools)
+    config = {
+        "callbacks": [callback_handler],
+        "configurable": {"chat": chat, "tool_node": tool_node},
+    }
 
-    # Stream tokens while waiting for completion
-    while not task.done():
+    # Run the graph with config including callbacks, signalling the stream
+    # loop once it finishes so no events are left behind in the queue
+    async def run_workflow():
         try:
-            data = await asyncio.wait_for(callback_queue.get(), timeout=0.1)
-            if data["type"] == "end":
-                logger.debug("Received end signal")
-                yield data
-            else:
-                yield data
-        except asyncio.TimeoutError:
-            continue
-        except asyncio.CancelledError:
-            logger.error("Task cancelled unexpectedly")
-            task.cancel()
-            raise
-        except Exception as e:
-            logger.error(f"Error in streaming loop: {str(e)}", exc_info=True)
-            raise
+            return await agent_graph.ainvoke({"messages": messages}, config=config)
+        finally:
+            callback_queue.put_nowait(_STREAM_DONE)
+
+    logger.info("Starting workflow execution")
+    task = asyncio.create_task(run_workflow())
+
+    # Stream events until the workflow signals completion, merging tokens
+    # that arrived while the consumer was busy so each wakeup sends one event
+    next_data = None
+    while True:
+        if next_data is None:
+            try:
+                data = await callback_queue.get()
+            except asyncio.CancelledError:
+                logger.error("Task cancelled unexpectedly")
+                task.cancel()
+                raise
+            except Exception as e:
+                logger.error("Error in streaming loop: %s", e, exc_info=True)
+                raise
+        else:
+            data, next_data = next_data, None
+        if data is _STREAM_DONE:
+            break
+        if data["type"] == "token":
+            data, next_data = coalesce_queued_tokens(data, callback_queue)
+        elif data["type"] == "end":
+            logger.debug("Received end signal")
+        yield data
 
     # Get final result
     try:
         result = await task
         logger.info("Workflow execution completed successfully")
         logger.debug(
-            f"Final result content length: {len(result['messages'][-1].content)}"
+            "Final result content length: %d", len(result["messages"][-1].content)
         )
     except Exception as e:
-        logger.error(f"Failed to get final result: {str(e)}", exc_info=True)
+        logger.error("Failed to get final result: %s", e, exc_info=True)
         raise
 
     yield {
@@ -17,7 +17,7 @@ from services.langgraph import execute_langgraph_stream
 from services.tweet_generator import generate_dao_tweet
 from services.twitter import TweetData, TwitterMentionHandler
 from tools.tools_factory import filter_tools_by_names, initialize_tools
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from uuid import UUID
 
 logger = configure_logger(__name__)
@@ -59,7 +59,9 @@ class TweetRunner(BaseRunner):
         super().__init__()
         self.twitter_handler = TwitterMentionHandler()
 
-    async def _process_tweet_message(self, message: Any, dao_messages: list) -> None:
+    async def _process_tweet_message(
+        self, message: Any, dao_messages_by_token: Dict[Tuple, Any]
+    ) -> None:
         """Process a single tweet message."""
         if not message.dao_id:
             logger.warning(f"Tweet message {message.id} has no dao_id")
@@ -77,7 +79,9 @@ class TweetRunner(BaseRunner):
             return
 
         # Find matching DAO message
-        matching_dao_message = self._find_matching_dao_message(token[0], dao_messages)
+        matching_dao_message = dao_messages_by_token.get(
+            (token[0].symbol, token[0].name, token[0].max_supply)
+        )
         if not matching_dao_message:
             logger.warning(
                 f"No matching DAO message found for dao_id: {message.dao_id} "
@@ -85,27 +89,37 @@ class TweetRunner(BaseRunner):
             )
             return
 
+        logger.debug(
+            f"Found matching DAO message: {matching_dao_message.id} for token {token[0].symbol}"
+        )
         await self._handle_tweet_response(message, dao, token[0], matching_dao_message)
 
-    def _find_matching_dao_message(
-        self, token: Any, dao_messages: list
-    ) -> Optional[Any]:
-        """Find matching DAO message based on token details."""
+    def _index_dao_messages(self, dao_messages: list) -> Dict[Tuple, Any]:
+        """Index DAO messages by token symbol, name and max supply.
+
+        Built once per run so each tweet message is matched with a dict lookup
+        instead of rescanning every processed DAO message.
+        """
+        dao_messages_by_token = {}
         for dao_message in dao_messages:
             if not isinstance(dao_message.message, dict):
                 continue
 
-            params = dao_message.message.get("parameters", {})
-            if (
-                params.get("token_symbol") == token.symbol
-                and params.get("token_name") == token.name
-                and params.get("token_max_supply") == token.max_supply
-            ):
-                logger.debug(
-                    f"Found matching DAO message: {dao_message.id} for token {token.symbol}"
+            try:
+                params = dao_message.message.get("parameters", {})
+                key = (
+                    params.get("token_symbol"),
+                    params.get("token_name"),
+                    params.get("token_max_supply"),
+                )
+                # Keep the first match, as the previous linear scan did
+                dao_messages_by_token.setdefault(key, dao_message)
+            except (AttributeError, TypeError) as e:
+                logger.warning(
+                    f"Skipping DAO message {dao_message.id} with invalid "
+                    f"token parameters: {str(e)}"
                 )
-                return dao_message
-        return None
+        return dao_messages_by_token
 
     async def _handle_tweet_response(
         self, message: Any, dao: Any, token: Any, dao_message: Any
@@ -205,11 +219,12 @@ class TweetRunner(BaseRunner):
                 filters=QueueMessageFilter(type="daos", is_processed=True)
             )
             logger.debug(f"Found {len(dao_messages)} processed DAO messages")
+            dao_messages_by_token = self._index_dao_messages(dao_messages)
 
             for message in queue_messages:
                 logger.info(f"Processing tweet message: {message}")
                 try:
-                    await self._process_tweet_message(message, dao_messages)
+                    await self._process_tweet_message(message, dao_messages_by_token)
                     backend.update_queue_message(
                         queue_message_id=message.id,
                         update_data=QueueMessageBase(is_processed=True),
@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -14,17 +15,20 @@ logger = configure_logger(__name__)
 async def execute_scheduled_job(agent_id: str, task_id: str, profile_id: str):
     """Execute a scheduled job with the given agent and task."""
 
-    task = backend.get_task(task_id=uuid.UUID(task_id))
+    # The lookups are independent, so run the blocking calls side by side
+    task, agent, profile = await asyncio.gather(
+        asyncio.to_thread(backend.get_task, task_id=uuid.UUID(task_id)),
+        asyncio.to_thread(backend.get_agent, agent_id=uuid.UUID(agent_id)),
+        asyncio.to_thread(backend.get_profile, profile_id=uuid.UUID(profile_id)),
+    )
     if not task:
         logger.error(f"Task with ID {task_id} not found")
         return
 
-    agent = backend.get_agent(agent_id=uuid.UUID(agent_id))
     if not agent:
         logger.error(f"Agent with ID {agent_id} not found")
         return
 
-    profile = backend.get_profile(profile_id=uuid.UUID(profile_id))
     if not profile:
         logger.error(f"Profile with ID {profile_id} not found")
         return
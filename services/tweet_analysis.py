@@ -1,6 +1,8 @@
+import asyncio
 import os
 from backend.factory import backend
 from backend.models import QueueMessageCreate, QueueMessageFilter, TweetType, XTweetBase
+from functools import lru_cache
 from langchain.prompts import PromptTemplate
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, Graph, StateGraph
@@ -112,22 +114,28 @@ def create_analysis_prompt() -> PromptTemplate:
     )
 
 
+# Parsed once at import; the template has no per-call inputs
+analysis_prompt = create_analysis_prompt()
+
+
+@lru_cache(maxsize=8)
 def create_analysis_graph(account_name: str = "@aibtcdevagent") -> Graph:
-    """Create the analysis graph."""
+    """Create the analysis graph, compiled once per account name."""
     # Create LLM
     llm = ChatOpenAI(temperature=0, model="gpt-4o")
 
-    # Create prompt
-    prompt = create_analysis_prompt()
-
     # Create analysis node
-    def analyze_tweet(state: AnalysisState) -> AnalysisState:
+    async def analyze_tweet(state: AnalysisState) -> AnalysisState:
         """Analyze the tweet and determine if it's worthy of processing."""
-        tokens = backend.list_tokens()
-        token_symbols_in_db = [token.symbol for token in tokens]
-        queued_messages = backend.list_queue_messages(
-            filters=QueueMessageFilter(type="daos", is_processed=False)
+        # The two symbol lookups are independent, so run them side by side
+        tokens, queued_messages = await asyncio.gather(
+            asyncio.to_thread(backend.list_tokens),
+            asyncio.to_thread(
+                backend.list_queue_messages,
+                filters=QueueMessageFilter(type="daos", is_processed=False),
+            ),
         )
+        token_symbols_in_db = [token.symbol for token in tokens]
         token_symbols_in_queue = [
             message.message["parameters"]["token_symbol"] for message in queued_messages
         ]
@@ -136,7 +144,7 @@ def create_analysis_graph(account_name: str = "@aibtcdevagent") -> Graph:
         token_symbols = list(set(token_symbols_in_db + token_symbols_in_queue))
 
         # Format prompt with state
-        formatted_prompt = prompt.format(
+        formatted_prompt = analysis_prompt.format(
             tweet_text=state["tweet_text"],
             filtered_content=state["filtered_content"],
             account_name=account_name,
@@ -144,7 +152,7 @@ def create_analysis_graph(account_name: str = "@aibtcdevagent") -> Graph:
         )
 
         # Get analysis from LLM
-        result = llm.invoke(formatted_prompt)
+        result = await llm.ainvoke(formatted_prompt)
 
         # Clean the content from markdown and get just the JSON
         content = result.content
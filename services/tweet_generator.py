@@ -1,3 +1,4 @@
+from functools import lru_cache
 from langchain.prompts import PromptTemplate
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, Graph, StateGraph
@@ -55,19 +56,20 @@ def create_generator_prompt() -> PromptTemplate:
     )
 
 
+generator_prompt = create_generator_prompt()
+
+
+@lru_cache(maxsize=1)
 def create_generator_graph() -> Graph:
-    """Create the generator graph."""
+    """Create the generator graph, compiled once and shared across calls."""
     # Create LLM
     llm = ChatOpenAI(temperature=0.7, model="gpt-4")
 
-    # Create prompt
-    prompt = create_generator_prompt()
-
     # Create generation node
     def generate_tweet(state: GeneratorState) -> GeneratorState:
         """Generate the tweet response."""
         # Format prompt with state
-        formatted_prompt = prompt.format(
+        formatted_prompt = generator_prompt.format(
             dao_name=state["dao_name"],
             dao_symbol=state["dao_symbol"],
             dao_mission=state["dao_mission"],
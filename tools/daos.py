@@ -17,7 +17,6 @@ from lib.platform import PlatformApi
 from pydantic import BaseModel, Field
 from services.daos import (
     TokenServiceError,
-    bind_token_to_dao,
     generate_dao_dependencies,
     generate_token_dependencies,
 )
@@ -121,27 +120,14 @@ class ContractDAODeployTool(BaseTool):
                 mission,
                 token_decimals_int,  # Convert to int for database
                 token_max_supply,
+                dao_id=dao_record.id,  # Bind to the dao in the same update
             )
             logger.debug(f"Generated token record type: {type(token_record)}")
             logger.debug(f"Generated token record content: {token_record}")
             logger.debug(f"Generated metadata_url: {metadata_url}")
 
-            # Bind token to dao
-            logger.debug("Step 4: Binding token to dao...")
-            bind_result = bind_token_to_dao(token_record.id, dao_record.id)
-            if not bind_result:
-                logger.error("Failed to bind token to dao")
-                logger.error(f"Token ID: {token_record.id}")
-                logger.error(f"DAO ID: {dao_record.id}")
-                return {
-                    "output": "",
-                    "error": "Failed to bind token to dao",
-                    "success": False,
-                }
-            logger.debug("Successfully bound token to dao")
-
             # Deploy contracts
-            logger.debug("Step 5: Deploying contracts...")
+            logger.debug("Step 3: Deploying contracts...")
             logger.debug(
                 f"BunScriptRunner parameters: wallet_id={self.wallet_id}, "
                 f"token_symbol={token_symbol}, token_name={token_name}, "
@@ -175,7 +161,7 @@ class ContractDAODeployTool(BaseTool):
                 }
 
             # Parse deployment output
-            logger.debug("Step 6: Parsing deployment output...")
+            logger.debug("Step 4: Parsing deployment output...")
             try:
                 deployment_data = json.loads(result["output"])
                 logger.debug(f"Parsed deployment data: {deployment_data}")
@@ -192,7 +178,7 @@ class ContractDAODeployTool(BaseTool):
                     dao_record.id, update_data=DAOBase(is_broadcasted=True)
                 )
                 # Update token record with contract information
-                logger.debug("Step 7: Updating token with contract information...")
+                logger.debug("Step 5: Updating token with contract information...")
                 contracts = deployment_data["contracts"]
                 token_updates = TokenBase(
                     contract_principal=contracts["token"]["contractPrincipal"],
@@ -209,7 +195,7 @@ class ContractDAODeployTool(BaseTool):
                     }
 
                 # Create extensions
-                logger.debug("Step 8: Creating extensions...")
+                logger.debug("Step 6: Creating extensions...")
                 for contract_name, contract_data in contracts.items():
                     platform = PlatformApi()
                     chainhook = platform.create_contract_deployment_hook(
@@ -91,6 +91,7 @@ from .wallet import (
 )
 from backend.factory import backend
 from backend.models import UUID, Profile, WalletFilter
+from functools import lru_cache
 from langchain.tools.base import BaseTool as LangChainBaseTool
 from lib.logger import configure_logger
 from pydantic import BaseModel, ConfigDict, create_model
@@ -134,6 +135,20 @@ def initialize_tools(
             except Exception as e:
                 logger.warning(f"Failed to get wallet for agent {agent_id}: {e}")
 
+    return _build_tools(profile_id, agent_id, wallet_id)
+
+
+@lru_cache(maxsize=1024)
+def _build_tools(
+    profile_id: Optional[UUID],
+    agent_id: Optional[UUID],
+    wallet_id: Optional[UUID],
+) -> Dict[str, LangChainBaseTool]:
+    """Build the tool map for a profile, agent and wallet.
+
+    Tools only hold these identifiers, so the same instances are reused by
+    every request with the same key. Callers must not mutate the returned dict.
+    """
     tools = {
         "alex_get_price_history": AlexGetPriceHistory(),
         "alex_get_swap_info": AlexGetSwapInfo(),